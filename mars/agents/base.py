@@ -2,14 +2,34 @@
 """
 Factory module for creating agent nodes in the swarm.
 Each node is a callable that takes current state and returns state update.
+Every node also carries an async twin (`node.anode`) that uses `ainvoke`,
+so the graph can await LLM calls instead of blocking the event loop.
 Handles proper message formatting for Mistral/vLLM endpoints.
+
+Prefix caching: vLLM reuses the KV cache of an identical prompt prefix across
+requests. Keep each agent's system prompt static (no per-call data) and put
+call-specific content after the conversation history, so repeated calls share
+the longest possible prefix.
 """
 
 # imports
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, AnyMessage
+from langchain_core.runnables import RunnableLambda
+
+
+def _prepare_messages(messages: List[AnyMessage]) -> List[AnyMessage]:
+    """Copies the history and appends the continuation marker when needed."""
+    invoke_messages = messages.copy()
+
+    # When continuing from an assistant message we need to signal continuation
+    # vLLM/Mistral often requires an empty user message in this situation
+    if messages and isinstance(messages[-1], AIMessage):
+        invoke_messages.append(HumanMessage(content=""))
+
+    return invoke_messages
 
 
 def create_agent_node(
@@ -26,7 +46,8 @@ def create_agent_node(
         agent_name: identifier used for logging and state tracking
 
     Returns:
-        Callable[[Dict[str, Any]], Dict[str, Any]]: node function that updates state
+        Callable[[Dict[str, Any]], Dict[str, Any]]: node function that updates state,
+            with its async counterpart attached as `node.anode`
     """
     prompt = ChatPromptTemplate.from_messages([
         ("system", system_prompt),
@@ -36,16 +57,17 @@ def create_agent_node(
     chain = prompt | llm
 
     def node(state: Dict[str, Any]) -> Dict[str, Any]:
-        messages: List[AnyMessage] = state["messages"]
-
-        invoke_messages = messages.copy()
+        invoke_messages = _prepare_messages(state["messages"])
+        response = chain.invoke({"messages": invoke_messages})
 
-        # When continuing from an assistant message we need to signal continuation
-        # vLLM/Mistral often requires an empty user message in this situation
-        if messages and isinstance(messages[-1], AIMessage):
-            invoke_messages.append(HumanMessage(content=""))
+        return {
+            "messages": [response],
+            "last_agent": agent_name
+        }
 
-        response = chain.invoke({"messages": invoke_messages})
+    async def anode(state: Dict[str, Any]) -> Dict[str, Any]:
+        invoke_messages = _prepare_messages(state["messages"])
+        response = await chain.ainvoke({"messages": invoke_messages})
 
         return {
             "messages": [response],
@@ -53,4 +75,21 @@ def create_agent_node(
         }
 
     node.__name__ = f"{agent_name}_node"
-    return node
\ No newline at end of file
+    anode.__name__ = f"{agent_name}_anode"
+    node.anode = anode
+    return node
+
+
+def as_graph_node(node: Callable[[Dict[str, Any]], Dict[str, Any]]) -> RunnableLambda:
+    """
+    Wraps a node function for LangGraph so that `ainvoke`/`astream` await
+    its async twin (if present) while `invoke` keeps using the sync version.
+
+    Args:
+        node: node function, optionally carrying an `anode` attribute
+
+    Returns:
+        RunnableLambda: runnable exposing both sync and async execution
+    """
+    afunc: Optional[Callable] = getattr(node, "anode", None)
+    return RunnableLambda(node, afunc=afunc, name=node.__name__)
@@ -1,70 +1,87 @@
 """
 Single Memory Agent factory
-Creates a specialized agent node for evaluating one specific Thought
+Creates the memory agent node that evaluates one held Thought per call
+
+Prompt layout is prefix-cache friendly: every memory agent uses the same system
+prompt and sees the same conversation, and the held Thought is delivered at the
+very end. The prompts of all agents in a swarm pass therefore share one
+byte-identical prefix that vLLM can prefill once and reuse.
 """
 
 # imports
 import json
-from typing import Callable
+from typing import Callable, List
 from datetime import datetime
 
+from langchain_core.messages import AnyMessage, HumanMessage
+
 from mars.types import Thought, MARSState
 from mars.agents.base import create_agent_node
 from mars.agents.memory.prompts import MEMORY_SYSTEM_PROMPT
 
 
 # helper classes
-# (none needed - responsibility delegated to base agent node)
+def _with_held_thought(messages: List[AnyMessage], held_text: str) -> List[AnyMessage]:
+    """
+    Appends the held Thought after the shared conversation.
+    Merged into a trailing user message (Mistral requires alternating roles),
+    otherwise added as a new user message.
+    """
+    if messages and isinstance(messages[-1], HumanMessage):
+        return messages[:-1] + [HumanMessage(content=f"{messages[-1].content}\n\n{held_text}")]
+    return messages + [HumanMessage(content=held_text)]
 
 
 # operational classes
 # (none needed here)
 
 
-# Core factory
-def create_single_memory_node(
-    llm,
-    thought: Thought
-) -> Callable[[MARSState], dict]:
+# Core factories
+def create_memory_agent_node(llm) -> Callable[[MARSState, Thought], dict]:
     """
-    Factory that creates a memory agent node specialized for one Thought.
+    Factory that creates one reusable memory agent node.
+    The prompt and chain are built once; the Thought to evaluate is passed per call,
+    so a swarm pass over N thoughts does not rebuild N chains.
 
     Args:
         llm: Language model instance (real or mock)
-        thought: The specific Thought this agent is responsible for
 
     Returns:
-        Callable[[MARSState], dict]: Node function returning delta updates
+        Callable[[MARSState, Thought], dict]: Node function returning delta updates
     """
     current_date_str = datetime.now().strftime("%Y-%m-%d")
 
-    # 1. Serialize thought to JSON
-    # 2. Escape curly braces to prevent LangChain prompt variable parsing
-    thought_json = json.dumps(thought, indent=2)
-    thought_safe = thought_json.replace("{", "{{").replace("}", "}}")
-
-    # Build system prompt with safely escaped thought content
-    system_content = (
-        MEMORY_SYSTEM_PROMPT.format(current_date=current_date_str)
-        + "\n\nHeld Thought to evaluate (as JSON):\n"
-        + thought_safe
-    )
+    # Shared by all memory agents - must not contain anything thought-specific
+    system_content = MEMORY_SYSTEM_PROMPT.format(current_date=current_date_str)
 
     # Create base agent node (prompt | llm chain + invocation logic)
     base_node = create_agent_node(
         llm=llm,
         system_prompt=system_content,
-        agent_name=f"memory_{thought['thought_id']}"
+        agent_name="memory"
     )
 
-    def memory_node(state: MARSState) -> dict:
+    def _input_state(state: MARSState, thought: Thought) -> MARSState:
+        # Held thought goes into a message (not the template), so no brace escaping is needed
+        held_text = "Held Thought to evaluate (as JSON):\n" + json.dumps(dict(thought), indent=2)
+        return {**state, "messages": _with_held_thought(state["messages"], held_text)}
+
+    def memory_node(state: MARSState, thought: Thought) -> dict:
         """
         Executes base node and returns only the delta (new messages).
         Compatible with both LangGraph and manual state merging.
         """
-        full_update = base_node(state)
+        full_update = base_node(_input_state(state, thought))
+        return {
+            "messages": full_update.get("messages", [])
+        }
+
+    async def memory_anode(state: MARSState, thought: Thought) -> dict:
+        """Async counterpart of memory_node (awaits the LLM call)."""
+        full_update = await base_node.anode(_input_state(state, thought))
         return {
             "messages": full_update.get("messages", [])
         }
 
-    return memory_node
\ No newline at end of file
+    memory_node.anode = memory_anode
+    return memory_node
@@ -1,23 +1,37 @@
 """
 Memory Swarm coordinator
-Manages sequential evaluation of all active memory agents (simulating parallelism)
+Manages evaluation of all active memory agents (sequential in sync mode, concurrent in async mode)
 Ensures prime seed thoughts are loaded only once and never duplicated or renamed
 New thoughts from generator get fresh IDs and are appended only when truly novel
 File location: ./mars/agents/memory/swarm.py
 """
 
 # imports
+import asyncio
+import re
 from typing import Dict, Any, List, Set
-from datetime import datetime
+from datetime import datetime, timezone
 
-from mars.types import MARSState, Thought
-from mars.agents.memory.single import create_single_memory_node
+from mars.types import (
+    MARSState,
+    Thought,
+    Decision,
+    DECISION_INJECT,
+    DECISION_REFRAME,
+    DECISION_GENERATE_NEW,
+    ACTIVE_MEMORY_SWARM,
+)
+from mars.agents.memory.single import create_memory_agent_node
 from mars.infrastructure.logging import get_thought_logger
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helper classes / functions
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Keyword scans for the mock scoring - one case-insensitive pass each, no lowercased copy
+_APPLICABLE_RE = re.compile(r"applicable|yes|relevant|supports", re.IGNORECASE)
+_MISMATCH_RE = re.compile(r"mismatch|conflict|contradict|outdated", re.IGNORECASE)
+
 def _deduplicate_thoughts(thoughts: List[Thought]) -> List[Thought]:
     """Return list of thoughts keeping only the most recent version of each thought_id"""
     if not thoughts:
@@ -49,7 +63,91 @@ def create_memory_swarm_node(llm):
     Factory that creates the memory swarm evaluation node.
     The node evaluates existing thoughts, decides on injection/reframing/new generation,
     prevents any thought ID duplication and keeps the state clean.
+    The memory agent chain is built once here and reused for every thought and pass.
     """
+    memory_agent = create_memory_agent_node(llm)
+    thought_gen = None
+
+    def _get_thought_gen():
+        """Thought generator used on mismatch (built on first use, then reused)"""
+        nonlocal thought_gen
+        if thought_gen is None:
+            from mars.agents.thought_generator.agent import create_thought_generator_node
+            thought_gen = create_thought_generator_node(llm, max_steps=2)  # Limit to 2 steps during swarm
+        return thought_gen
+
+    def _apply_evaluation(
+        thought: Thought,
+        eval_result: Dict[str, Any],
+        context_snippet: str,
+        injection_queue: List[Thought]
+    ) -> Decision | None:
+        """
+        Scores one memory agent reply, logs it and applies the decision to the thought.
+
+        Returns:
+            Decision | None: decision taken ("inject" | "reframe" | "generate_new"),
+                or None when the agent produced no reply
+        """
+        if not eval_result.get("messages"):
+            return None
+
+        # Safe content extraction from evaluation result
+        eval_msg = eval_result["messages"][-1]
+        response_text = _safe_extract_content(eval_msg)
+
+        # ── Simple mock scoring (to be replaced with real CoT + embedding scoring)
+        is_applicable = _APPLICABLE_RE.search(response_text) is not None
+        relevance_score = 0.85 if is_applicable else 0.42
+
+        # Decision logic
+        decision = DECISION_INJECT if relevance_score > 0.70 else DECISION_REFRAME
+        if _MISMATCH_RE.search(response_text):
+            decision = DECISION_GENERATE_NEW
+
+        # Logging
+        get_thought_logger().log_evaluation(
+            thought_id=thought["thought_id"],
+            current_orchestrator_snippet=context_snippet,
+            relevance_score=relevance_score,
+            decision=decision,
+            reasoning=f"Response snippet: {response_text[:180].lower()}..."
+        )
+
+        # Update thought metadata (mutates in place)
+        thought["relevance_score"] = relevance_score
+        thought["last_evaluated"] = datetime.now(timezone.utc).isoformat()
+
+        # ── Apply decision ─────────────────────────────────────────────
+        if relevance_score > 0.70:
+            injection_queue.append(thought)
+
+        if decision is DECISION_REFRAME:
+            # Minimal re-framing marker - can be greatly improved later
+            current_narrative = thought.get("narrative", "")
+            thought["narrative"] = f"{current_narrative} [re-framed with new context: {context_snippet[:100]}...]"
+
+        return decision
+
+    def _merge_new_thoughts(
+        gen_delta: Dict[str, Any],
+        working_thoughts: List[Thought],
+        existing_ids: Set[str]
+    ) -> None:
+        """Appends generated thoughts whose IDs are not yet known (silently skips duplicates)."""
+        for new_thought in gen_delta.get("thoughts", []):
+            new_id = new_thought["thought_id"]
+            if new_id not in existing_ids:
+                working_thoughts.append(new_thought)
+                existing_ids.add(new_id)
+
+    def _context_snippet(state: MARSState) -> str:
+        """Safe context extraction (fixes AIMessage.get() error)"""
+        messages = state.get("messages", [])
+        last_msg = messages[-1] if messages else None
+        context_text = _safe_extract_content(last_msg)
+        return (context_text[:400] + "...") if len(context_text) > 400 else context_text
+
     def swarm_node(state: MARSState) -> Dict[str, Any]:
         """
         Main swarm processing logic:
@@ -59,7 +157,7 @@ def create_memory_swarm_node(llm):
           - Logs evaluation decisions
           - Queues highly relevant thoughts for injection
           - Reframes low-relevance thoughts in place
-          - Triggers new thought generation on strong mismatch/conflict
+          - Triggers new thought generation on strong mismatch/conflict (once per pass)
           - Appends only genuinely new thoughts with unique IDs
 
         Args:
@@ -73,7 +171,7 @@ def create_memory_swarm_node(llm):
         """
         thoughts = state.get("thoughts", [])
         if not thoughts:
-            return {"injection_queue": [], "active_agent": "memory_swarm"}
+            return {"injection_queue": [], "active_agent": ACTIVE_MEMORY_SWARM}
 
         # ── Phase 1: Defensive deduplication ───────────────────────────────
         unique_thoughts = _deduplicate_thoughts(thoughts)
@@ -81,72 +179,25 @@ def create_memory_swarm_node(llm):
 
         working_thoughts = unique_thoughts.copy()  # we will append here if needed
         injection_queue: List[Thought] = []
-
-        # ── Safe context extraction (fixes AIMessage.get() error) ──────────
-        messages = state.get("messages", [])
-        last_msg = messages[-1] if messages else None
-        context_text = _safe_extract_content(last_msg)
-        context_snippet = (context_text[:400] + "...") if len(context_text) > 400 else context_text
+        context_snippet = _context_snippet(state)
+        generated = False
 
         # ── Phase 2: Evaluate each thought ─────────────────────────────────
         for thought in working_thoughts:
-            # Create specialized memory evaluation agent for this thought
-            memory_node = create_single_memory_node(llm, thought)
-            eval_result = memory_node(state)
-            
-            if not eval_result.get("messages"):
-                continue
-
-            # Safe content extraction from evaluation result
-            eval_msg = eval_result["messages"][-1]
-            response_text = _safe_extract_content(eval_msg).lower()
-
-            # ── Simple mock scoring (to be replaced with real CoT + embedding scoring)
-            is_applicable = any(word in response_text for word in ["applicable", "yes", "relevant", "supports"])
-            relevance_score = 0.85 if is_applicable else 0.42
-
-            # Decision logic
-            decision = "inject" if relevance_score > 0.70 else "reframe"
-            if any(word in response_text for word in ["mismatch", "conflict", "contradict", "outdated"]):
-                decision = "generate_new"
-
-            # Logging
-            thought_logger = get_thought_logger(thought)
-            thought_logger.log_evaluation(
-                current_orchestrator_snippet=context_snippet,
-                relevance_score=relevance_score,
-                decision=decision,
-                reasoning=f"Response snippet: {response_text[:180]}..."
-            )
-
-            # Update thought metadata (mutates in place)
-            thought["relevance_score"] = relevance_score
-            thought["last_evaluated"] = datetime.utcnow().isoformat()
-
-            # ── Apply decision ─────────────────────────────────────────────
-            if relevance_score > 0.70:
-                injection_queue.append(thought)
-
-            if decision == "reframe":
-                # Minimal re-framing marker - can be greatly improved later
-                current_narrative = thought.get("narrative", "")
-                thought["narrative"] = f"{current_narrative} [re-framed with new context: {context_snippet[:100]}...]"
-
-            elif decision == "generate_new":
+            # Evaluate this thought with the shared memory agent
+            eval_result = memory_agent(state, thought)
+
+            decision = _apply_evaluation(thought, eval_result, context_snippet, injection_queue)
+
+            # The generator only sees the shared state, so a second run in the same
+            # pass would repeat the same LLM calls - generate at most once per pass
+            if decision is DECISION_GENERATE_NEW and not generated:
+                generated = True
                 # Controlled generation of new thought (limited to prevent hangs)
                 try:
-                    from mars.agents.thought_generator.agent import create_thought_generator_node
-                    thought_gen = create_thought_generator_node(llm, max_steps=2)  # Limit to 2 steps during swarm
-                    gen_delta = thought_gen(state)
-                    new_thoughts = gen_delta.get("thoughts", [])
-                    
-                    for new_thought in new_thoughts:
-                        new_id = new_thought["thought_id"]
-                        if new_id not in existing_ids:
-                            working_thoughts.append(new_thought)
-                            existing_ids.add(new_id)
-                        # Silently skip duplicates
-                        
+                    gen_delta = _get_thought_gen()(state)
+                    _merge_new_thoughts(gen_delta, working_thoughts, existing_ids)
+
                 except (ImportError, Exception) as e:
                     print(f"Warning: New thought generation failed → {str(e)}")
 
@@ -154,7 +205,55 @@ def create_memory_swarm_node(llm):
         return {
             "thoughts": working_thoughts,
             "injection_queue": injection_queue,
-            "active_agent": "memory_swarm"
+            "active_agent": ACTIVE_MEMORY_SWARM
+        }
+
+    async def swarm_anode(state: MARSState) -> Dict[str, Any]:
+        """
+        Async counterpart of swarm_node.
+        Memory agents are independent of each other, so each round of evaluations
+        is scattered with asyncio.gather and the decisions are applied in order.
+        Thoughts generated during a round are evaluated in the next one.
+        """
+        thoughts = state.get("thoughts", [])
+        if not thoughts:
+            return {"injection_queue": [], "active_agent": ACTIVE_MEMORY_SWARM}
+
+        unique_thoughts = _deduplicate_thoughts(thoughts)
+        existing_ids: Set[str] = {t["thought_id"] for t in unique_thoughts}
+
+        working_thoughts = unique_thoughts.copy()
+        injection_queue: List[Thought] = []
+        context_snippet = _context_snippet(state)
+        generated = False
+
+        pending = working_thoughts.copy()
+        while pending:
+            eval_results = await asyncio.gather(*(
+                memory_agent.anode(state, thought)
+                for thought in pending
+            ))
+            round_end = len(working_thoughts)
+
+            for thought, eval_result in zip(pending, eval_results):
+                decision = _apply_evaluation(thought, eval_result, context_snippet, injection_queue)
+
+                if decision is DECISION_GENERATE_NEW and not generated:
+                    generated = True
+                    try:
+                        gen_delta = await _get_thought_gen().anode(state)
+                        _merge_new_thoughts(gen_delta, working_thoughts, existing_ids)
+
+                    except (ImportError, Exception) as e:
+                        print(f"Warning: New thought generation failed → {str(e)}")
+
+            pending = working_thoughts[round_end:]
+
+        return {
+            "thoughts": working_thoughts,
+            "injection_queue": injection_queue,
+            "active_agent": ACTIVE_MEMORY_SWARM
         }
 
-    return swarm_node
\ No newline at end of file
+    swarm_node.anode = swarm_anode
+    return swarm_node
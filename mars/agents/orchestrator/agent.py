@@ -33,13 +33,8 @@ def create_orchestrator_node(llm):
     logger = get_orchestrator_logger()
     step_counter = 0
 
-    def orchestrator_node(state: dict) -> dict:
-        nonlocal step_counter
-        step_counter += 1
-
-        # Execute normal orchestrator logic
-        update = base_node(state)
-
+    def _log_step(state: dict, update: dict, step_number: int) -> None:
+        """Writes the orchestrator's latest response to the dialogue trace."""
         # Extract latest message (the orchestrator's response)
         messages = update.get("messages", [])
         if messages:
@@ -47,13 +42,30 @@ def create_orchestrator_node(llm):
 
             # Log the step
             logger.log_step(
-                step_number=step_counter,
+                step_number=step_number,
                 orchestrator_output=response_text,
                 # You can pass injected_summary from state if you store it
                 # injected_summary=state.get("last_injection", None),
                 active_thought_ids=[t["thought_id"] for t in state.get("thoughts", [])]
             )
 
+    def orchestrator_node(state: dict) -> dict:
+        nonlocal step_counter
+        step_counter += 1
+
+        # Execute normal orchestrator logic
+        update = base_node(state)
+        _log_step(state, update, step_counter)
+        return update
+
+    async def orchestrator_anode(state: dict) -> dict:
+        nonlocal step_counter
+        step_counter += 1
+        step_number = step_counter
+
+        update = await base_node.anode(state)
+        _log_step(state, update, step_number)
         return update
 
-    return orchestrator_node
\ No newline at end of file
+    orchestrator_node.anode = orchestrator_anode
+    return orchestrator_node
@@ -6,7 +6,7 @@ File location: ./mars/agents/thought_generator/agent.py
 
 # imports
 from typing import Dict, List
-from datetime import datetime
+from datetime import datetime, timezone
 
 from langchain_core.messages import HumanMessage
 
@@ -43,7 +43,7 @@ def create_thought_generator_node(llm, max_steps: int = MAX_GUIDED_STEPS):
     Returns:
         Callable: A node function that takes state and returns delta updates
     """
-    current_date_str = datetime.utcnow().strftime("%Y-%m-%d")
+    current_date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     system_content = THOUGHT_GENERATOR_SYSTEM_PROMPT.format(current_date=current_date_str)
 
     base_node = create_agent_node(
@@ -54,25 +54,17 @@ def create_thought_generator_node(llm, max_steps: int = MAX_GUIDED_STEPS):
 
     logger = get_thought_generator_logger()
 
-    def thought_node(state: Dict) -> Dict:
+    def _plan_cycle(state: Dict):
         """
-        Main generation logic with step limitation and early exit protection.
-
-        Args:
-            state: Current shared MARS state dictionary
+        Prepares the guided prompts for one generation cycle.
 
         Returns:
-            dict: Delta containing:
-                - messages: New messages added during generation
-                - thoughts: List of newly created Thought dictionaries
+            tuple | None: (primes, list of full prompts) or None when skipped
         """
-        new_messages = []
-        new_thoughts: List[Thought] = []
-
         # Early exit if no meaningful context exists
         if not state.get("messages") and not state.get("core_context"):
             logger.append("No meaningful context available → generation skipped")
-            return {"messages": [], "thoughts": []}
+            return None
 
         # Extract core context safely
         core_content = (
@@ -95,49 +87,108 @@ def create_thought_generator_node(llm, max_steps: int = MAX_GUIDED_STEPS):
             f"Starting generation cycle — using {len(active_sequence)}/{len(GUIDED_PROMPT_SEQUENCE)} guided steps"
         )
 
-        for i, prompt_template in enumerate(active_sequence, 1):
-            # Prepare the full prompt for this step
-            full_prompt = prompt_template.format(
+        prompts = [
+            prompt_template.format(
                 core_content=core_content,
                 prime_context=prime_context
             )
+            for prompt_template in active_sequence
+        ]
+        return primes, prompts
+
+    def _step_input(state: Dict, full_prompt: str) -> Dict:
+        """Prepare input for LLM call"""
+        input_state = state.copy()
+        input_state["messages"] = input_state.get("messages", []) + [HumanMessage(content=full_prompt)]
+        return input_state
+
+    def _collect_step(
+        step: int,
+        full_prompt: str,
+        result: Dict,
+        primes: List[Thought],
+        new_messages: List,
+        new_thoughts: List[Thought]
+    ) -> None:
+        """Logs one generation step and turns its reply into a new Thought."""
+        # Extract response safely
+        response = result["messages"][-1].content if result.get("messages") else ""
+
+        # Log this generation step
+        logger.log_step(
+            step=step,
+            prompt=full_prompt,
+            reply=response
+        )
+
+        # Parse response into narrative + meta (fallback if format not followed)
+        if "Meta:" in response:
+            narrative, meta_part = response.split("Meta:", 1)
+            meta_narrative = meta_part.strip()
+        else:
+            narrative = response.strip()
+            meta_narrative = "Generated from guided reflection step"
+
+        # Create new atomic Thought
+        new_thought = create_thought(
+            narrative=narrative,
+            meta_narrative=meta_narrative,
+            origins=[p["thought_id"] for p in primes] if primes else [],
+            initial_relevance=DEFAULT_RELEVANCE_NEW,
+            is_seed=False
+        )
+
+        new_thoughts.append(new_thought)
+        new_messages.extend(result.get("messages", []))
+
+    def thought_node(state: Dict) -> Dict:
+        """
+        Main generation logic with step limitation and early exit protection.
+
+        Args:
+            state: Current shared MARS state dictionary
+
+        Returns:
+            dict: Delta containing:
+                - messages: New messages added during generation
+                - thoughts: List of newly created Thought dictionaries
+        """
+        new_messages = []
+        new_thoughts: List[Thought] = []
+
+        plan = _plan_cycle(state)
+        if plan is None:
+            return {"messages": [], "thoughts": []}
+        primes, prompts = plan
+
+        for i, full_prompt in enumerate(prompts, 1):
+            try:
+                result = base_node(_step_input(state, full_prompt))
+                _collect_step(i, full_prompt, result, primes, new_messages, new_thoughts)
+
+            except Exception as e:
+                logger.append(f"WARNING: Generation step {i} failed → {str(e)}")
+                break  # Stop on first serious error
+
+        return {
+            "messages": new_messages,
+            "thoughts": new_thoughts
+        }
+
+    async def thought_anode(state: Dict) -> Dict:
+        """Async counterpart of thought_node (awaits each guided step)."""
+        new_messages = []
+        new_thoughts: List[Thought] = []
 
-            # Prepare input for LLM call
-            input_state = state.copy()
-            input_state["messages"] = input_state.get("messages", []) + [HumanMessage(content=full_prompt)]
+        plan = _plan_cycle(state)
+        if plan is None:
+            return {"messages": [], "thoughts": []}
+        primes, prompts = plan
 
+        for i, full_prompt in enumerate(prompts, 1):
             try:
-                result = base_node(input_state)
-
-                # Extract response safely
-                response = result["messages"][-1].content if result.get("messages") else ""
-
-                # Log this generation step
-                logger.log_step(
-                    step=i,
-                    prompt=full_prompt,
-                    reply=response
-                )
-
-                # Parse response into narrative + meta (fallback if format not followed)
-                if "Meta:" in response:
-                    narrative, meta_part = response.split("Meta:", 1)
-                    meta_narrative = meta_part.strip()
-                else:
-                    narrative = response.strip()
-                    meta_narrative = "Generated from guided reflection step"
-
-                # Create new atomic Thought
-                new_thought = create_thought(
-                    narrative=narrative,
-                    meta_narrative=meta_narrative,
-                    origins=[p["thought_id"] for p in primes] if primes else [],
-                    initial_relevance=DEFAULT_RELEVANCE_NEW,
-                    is_seed=False
-                )
-
-                new_thoughts.append(new_thought)
-                new_messages.extend(result.get("messages", []))
+                result = await base_node.anode(_step_input(state, full_prompt))
+                _collect_step(i, full_prompt, result, primes, new_messages, new_thoughts)
 
             except Exception as e:
                 logger.append(f"WARNING: Generation step {i} failed → {str(e)}")
@@ -148,4 +199,5 @@ def create_thought_generator_node(llm, max_steps: int = MAX_GUIDED_STEPS):
             "thoughts": new_thoughts
         }
 
-    return thought_node
\ No newline at end of file
+    thought_node.anode = thought_anode
+    return thought_node
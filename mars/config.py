@@ -10,12 +10,18 @@ class LLMConfig(BaseModel):
     model: str = Field(..., description="Model identifier/path")
     temperature: float = Field(0.0, ge=0.0, le=2.0)
     max_tokens: int | None = None
+    rate_limit_rpm: int | None = Field(None, ge=1, description="Client-side cap on requests per minute (None = unlimited)")
+    cache_backend: Literal["none", "memory", "sqlite"] = Field("none", description="Response cache for deterministic (temperature=0) calls")
+    cache_path: str = Field(".mars_llm_cache.db", description="Database file used by the sqlite cache backend")
+    stream_chunk_timeout: float = Field(60.0, gt=0, description="Max seconds between streamed events before giving up")
 
 
 class AppConfig(BaseModel):
     """Global application configuration"""
 
     llm: LLMConfig = Field(...)
+    max_concurrency: int = Field(4, ge=1, description="Max parallel graph runs in MARSRunner.arun_batch")
+    checkpointing: bool = Field(True, description="Snapshot graph state per step (required to resume a thread_id)")
 
     # Later we will add:
     # neo4j_uri: str
@@ -14,7 +14,7 @@ from typing import Dict, Any, List
 
 from langchain_core.messages import AIMessage, HumanMessage, AnyMessage
 
-from mars.types import MARSState, create_thought
+from mars.types import MARSState, Thought, ACTIVE_ORCHESTRATOR, append_messages, create_thought
 from mars.infrastructure.llm import create_llm
 from mars.agents.orchestrator.agent import create_orchestrator_node
 from mars.agents.summary.agent import create_summary_node
@@ -35,12 +35,12 @@ class MockLLM:
 # Operational classes
 # ──────────────────────────────────────────────────────────────────────────────
 
-def load_seed_thoughts(seeds_dir: str = "mars/memories/seeds") -> List[Dict[str, Any]]:
+def load_seed_thoughts(seeds_dir: str = "mars/memories/seeds") -> List[Thought]:
     """
     Loads all prime seed thoughts from JSON files in the seeds directory.
 
     Returns:
-        List[Dict[str, Any]]: List of loaded thought dictionaries
+        List[Thought]: List of loaded seed thoughts
     """
     seeds_path = Path(seeds_dir)
     if not seeds_path.exists():
@@ -53,7 +53,7 @@ def load_seed_thoughts(seeds_dir: str = "mars/memories/seeds") -> List[Dict[str,
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 if all(key in data for key in ["thought_id", "narrative", "meta_narrative"]):
-                    loaded_thoughts.append(data)
+                    loaded_thoughts.append(Thought.from_dict(data))
                 else:
                     print(f"Warning: Invalid seed file format: {file_path}")
         except Exception as e:
@@ -70,7 +70,9 @@ def merge_state_updates(original: MARSState, update: Dict[str, Any]) -> MARSStat
     """Safely merges node updates into full state without losing keys."""
     new_state = original.copy()
     for key, value in update.items():
-        if isinstance(value, list) and key in ("messages", "thoughts", "injection_queue"):
+        if isinstance(value, list) and key == "messages":
+            new_state[key] = append_messages(new_state.get(key, []), value)
+        elif isinstance(value, list) and key in ("thoughts", "injection_queue"):
             new_state[key] = new_state.get(key, []) + value
         else:
             new_state[key] = value
@@ -90,7 +92,7 @@ def print_last_message(state: MARSState, label: str = "Last message") -> None:
     print(f"{label}:\n{content}\n")
 
 
-def print_thought_summary(thoughts: List[Dict[str, Any]], prefix: str = "Thoughts") -> None:
+def print_thought_summary(thoughts: List[Thought], prefix: str = "Thoughts") -> None:
     """
     Prints a concise summary of all current thoughts (prime + generated).
     """
@@ -163,7 +165,7 @@ def manual_graph_trace(
         "core_context": {"topic": "Principles of tort law in New York"},
         "thoughts": all_initial_thoughts,
         "injection_queue": [],
-        "active_agent": "orchestrator",
+        "active_agent": ACTIVE_ORCHESTRATOR,
         "last_handoff_reason": None
     }
 
@@ -11,9 +11,11 @@ File location: mars/core/graph.py
 # imports
 from typing import Dict, Any, Callable, List, Literal, Optional
 from langgraph.graph import StateGraph, END
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 
 from mars.types import MARSState, Thought
+from mars.agents.base import as_graph_node
 from mars.agents.orchestrator.agent import create_orchestrator_node
 from mars.agents.summary.agent import create_summary_node
 from mars.agents.thought_generator.agent import create_thought_generator_node
@@ -72,23 +74,41 @@ def route_after_memory_swarm(state: MARSState) -> str:
 class MARSGraph:
     """
     Builds and compiles the LangGraph workflow for the entire MARS swarm.
-    Provides compiled runnable application.
+    Provides the compiled runnable application (`app`, checkpointed) and the same
+    graph compiled without a checkpointer (`ephemeral_app`) for one-off runs
+    that are never resumed.
     """
 
-    def __init__(self, llm):
+    def __init__(self, llm, checkpointing: bool = True, checkpointer: Optional[BaseCheckpointSaver] = None):
+        """
+        Args:
+            llm: Language model instance shared by all agent nodes
+            checkpointing: Persist state after every super-step (needed to resume threads);
+                disable to skip per-step state serialization entirely
+            checkpointer: Existing checkpointer to reuse (e.g. another graph's, so both
+                can resume the same threads); a new MemorySaver is created if None
+        """
         self.llm = llm
-        self.checkpointer = MemorySaver()  # simple in-memory persistence
-        self.app = self._build()
-
-    def _build(self):
-        """Internal method - constructs the graph structure."""
+        if not checkpointing:
+            self.checkpointer = None
+        else:
+            self.checkpointer = checkpointer or MemorySaver()  # simple in-memory persistence
+
+        builder = self._build()
+        # Compile with checkpointing (None → no per-step state snapshots)
+        self.app = builder.compile(checkpointer=self.checkpointer)
+        # Nothing to resume → skip per-step serialization entirely
+        self.ephemeral_app = builder.compile() if self.checkpointer is not None else self.app
+
+    def _build(self) -> StateGraph:
+        """Internal method - constructs the (uncompiled) graph structure."""
         builder = StateGraph(MARSState)
 
-        # Nodes - each agent type gets its own node
-        builder.add_node("orchestrator",      create_orchestrator_node(self.llm))
-        builder.add_node("summary",           create_summary_node(self.llm))
-        builder.add_node("thought_generator", create_thought_generator_node(self.llm))
-        builder.add_node("memory_swarm",      create_memory_swarm_node(self.llm))
+        # Nodes - each agent type gets its own node (sync + async execution)
+        builder.add_node("orchestrator",      as_graph_node(create_orchestrator_node(self.llm)))
+        builder.add_node("summary",           as_graph_node(create_summary_node(self.llm)))
+        builder.add_node("thought_generator", as_graph_node(create_thought_generator_node(self.llm)))
+        builder.add_node("memory_swarm",      as_graph_node(create_memory_swarm_node(self.llm)))
 
         # Entry point: always start with orchestrator
         builder.set_entry_point("orchestrator")
@@ -113,8 +133,7 @@ class MARSGraph:
         # For now: cycle ends after orchestrator (later: add proper termination condition)
         builder.add_edge("orchestrator", END)
 
-        # Compile with checkpointing
-        return builder.compile(checkpointer=self.checkpointer)
+        return builder
 
     def invoke(self, initial_state: MARSState, config: Optional[Dict] = None) -> MARSState:
         """
@@ -123,6 +142,13 @@ class MARSGraph:
         """
         return self.app.invoke(initial_state, config=config)
 
+    async def ainvoke(self, initial_state: MARSState, config: Optional[Dict] = None) -> MARSState:
+        """
+        Execute the full graph workflow asynchronously.
+        Agent nodes await their LLM calls, so the event loop stays free.
+        """
+        return await self.app.ainvoke(initial_state, config=config)
+
     def stream(self, initial_state: MARSState):
         """
         Stream graph execution events (useful for real-time logging / UI).
@@ -6,20 +6,24 @@ Handles thread management for persistence and state resumption.
 """
 
 # imports
-from typing import List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from langchain_core.messages import AnyMessage, HumanMessage
 
 from mars.config import AppConfig
-from mars.infrastructure.llm import create_llm
+from mars.infrastructure.llm import create_llm, create_streaming_llm
 from mars.core.graph import MARSGraph
 from mars.core.state import MARSState
+from mars.types import ACTIVE_ORCHESTRATOR
 
 
 class MARSRunner:
     """
     Core runner class that ties configuration, LLM and graph together.
-    Provides simple run interface while managing thread_id for checkpointer.
+    Provides simple run interface. Runs with a thread_id are checkpointed and
+    can be resumed; runs without one use the checkpoint-free graph, so they
+    pay no per-step serialization and leave nothing behind.
     """
 
     def __init__(self, config: AppConfig):
@@ -31,44 +35,157 @@ class MARSRunner:
         """
         self.config = config
         self.llm = create_llm(config)
-        self.graph = MARSGraph(self.llm)
-        self.thread_id = "mars-thread-001"  # Fixed thread ID for prototype
+        self.graph = MARSGraph(self.llm, checkpointing=config.checkpointing)
+        self._stream_graph: Optional[MARSGraph] = None  # built on first arun_stream
 
-    def run(self, user_message: str) -> str:
+    def run(self, user_message: str, thread_id: Optional[str] = None) -> str:
+        """
+        Synchronous entry point (CLI) - invokes the graph with the sync agent nodes
+        (no event loop, so it can be called any number of times).
+
+        Args:
+            user_message (str): User input question/query
+            thread_id (Optional[str]): Checkpointer thread to resume (None → one-off run)
+
+        Returns:
+            str: Final answer extracted from the last message
+        """
+        final_state = self._app_for(thread_id).invoke(
+            input=self._initial_state(user_message),
+            config=self._graph_config(thread_id)
+        )
+
+        return self._extract_answer(final_state)
+
+    async def arun(self, user_message: str, thread_id: Optional[str] = None) -> str:
         """
         Executes the full MARS swarm workflow for a single user query.
+        Awaits the graph, so concurrent queries can interleave their LLM calls.
 
         Args:
             user_message (str): User input question/query
+            thread_id (Optional[str]): Checkpointer thread to resume (None → one-off run)
 
         Returns:
             str: Final answer extracted from the last message
         """
-        # Prepare initial state
-        initial_state: MARSState = {
+        # Execute the graph - pass config correctly to the underlying app
+        # Since MARSGraph.ainvoke() is a wrapper, we must call the internal app with config
+        final_state = await self._app_for(thread_id).ainvoke(
+            input=self._initial_state(user_message),
+            config=self._graph_config(thread_id)
+        )
+
+        return self._extract_answer(final_state)
+
+    async def arun_stream(self, user_message: str, thread_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Executes the workflow for one query and yields orchestrator tokens as they arrive.
+        Uses a separate graph built on the streaming LLM that shares the checkpointer
+        of `self.graph`, so threads started by `arun` can be resumed here (and vice
+        versa). Raises asyncio.TimeoutError
+        if no graph event arrives within `config.llm.stream_chunk_timeout` seconds.
+
+        Args:
+            user_message (str): User input question/query
+            thread_id (Optional[str]): Checkpointer thread to resume (None → one-off run)
+
+        Yields:
+            str: Content chunks generated by the orchestrator
+        """
+        if self._stream_graph is None:
+            self._stream_graph = MARSGraph(
+                create_streaming_llm(self.config),
+                checkpointing=self.config.checkpointing,
+                checkpointer=self.graph.checkpointer
+            )
+
+        events = self._app_for(thread_id, self._stream_graph).astream_events(
+            self._initial_state(user_message),
+            config=self._graph_config(thread_id),
+            version="v2"
+        )
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(anext(events), timeout=self.config.llm.stream_chunk_timeout)
+                except StopAsyncIteration:
+                    break
+
+                if (
+                    event["event"] == "on_chat_model_stream"
+                    and event.get("metadata", {}).get("langgraph_node") == "orchestrator"
+                ):
+                    content = event["data"]["chunk"].content
+                    if content:
+                        yield content
+        finally:
+            await events.aclose()
+
+    async def arun_batch(self, messages: List[str], return_exceptions: bool = False) -> List[Union[str, Exception]]:
+        """
+        Executes the workflow for many independent queries concurrently.
+        Queries run as one-off (checkpoint-free) runs; at most `config.max_concurrency`
+        graph runs are in flight at once (vLLM batches the requests server-side).
+        A failing query never cancels the others - every run finishes first.
+
+        Args:
+            messages (List[str]): User queries
+            return_exceptions (bool): Put the exception of a failed query in its
+                slot instead of raising it (after all runs have finished)
+
+        Returns:
+            List[Union[str, Exception]]: Final answers, in the same order as the queries
+        """
+        if not messages:
+            return []
+
+        states = [self._initial_state(message) for message in messages]
+
+        # return_exceptions=True → one failing query neither cancels nor loses the others
+        final_states = await self.graph.ephemeral_app.abatch(
+            states,
+            config={"max_concurrency": self.config.max_concurrency},
+            return_exceptions=True
+        )
+
+        results: List[Union[str, Exception]] = []
+        for final_state in final_states:
+            if isinstance(final_state, Exception):
+                if not return_exceptions:
+                    raise final_state
+                results.append(final_state)
+            else:
+                results.append(self._extract_answer(final_state))
+        return results
+
+    def _app_for(self, thread_id: Optional[str], graph: Optional[MARSGraph] = None):
+        """Compiled graph for one run: checkpointed for a thread_id, checkpoint-free otherwise."""
+        graph = graph or self.graph
+        return graph.app if thread_id is not None else graph.ephemeral_app
+
+    @staticmethod
+    def _graph_config(thread_id: Optional[str]) -> Dict[str, Any]:
+        """LangGraph config for one run (thread_id only when the run is checkpointed)."""
+        if thread_id is None:
+            return {}
+        return {"configurable": {"thread_id": thread_id}}
+
+    @staticmethod
+    def _initial_state(user_message: str) -> MARSState:
+        """Builds the starting graph state for one user query."""
+        return {
             "messages": [HumanMessage(content=user_message)],
             "core_context": {},
             "thoughts": [],
             "injection_queue": [],
-            "active_agent": "orchestrator",
+            "active_agent": ACTIVE_ORCHESTRATOR,
             "last_handoff_reason": None
         }
 
-        # Prepare LangGraph config with required thread_id
-        graph_config = {
-            "configurable": {
-                "thread_id": self.thread_id,
-            }
-        }
-
-        # Execute the graph - pass config correctly to the underlying app
-        # Since MARSGraph.invoke() is a wrapper, we must call the internal app with config
-        final_state = self.graph.app.invoke(
-            input=initial_state,
-            config=graph_config
-        )
-
-        # Extract final answer from messages
+    @staticmethod
+    def _extract_answer(final_state: MARSState) -> str:
+        """Extracts the final answer from the last message of a finished run."""
         final_messages: List[AnyMessage] = final_state.get("messages", [])
         if final_messages:
             return final_messages[-1].content
@@ -85,6 +202,6 @@ if __name__ == "__main__":
     print("User:", test_query)
     print("-" * 50)
 
-    answer = runner.run(test_query)
+    answer = asyncio.run(runner.arun(test_query))
     print("Final Answer:")
     print(answer)
\ No newline at end of file
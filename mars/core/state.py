@@ -4,9 +4,10 @@ Replaces the minimal BasicAgentState with complete structure.
 """
 
 # imports
-from typing import TypedDict, Annotated, List, Dict, Any, Literal, Optional
+from typing import TypedDict, Annotated, List, Dict, Any, Optional
 from langchain_core.messages import AnyMessage
-import operator
+
+from mars.types import ActiveAgent, Thought, append_messages
 
 # helper classes (none needed here)
 
@@ -16,9 +17,9 @@ class MARSState(TypedDict):
     Contains conversation history, core reasoning frontier, all thoughts,
     pending injections, and routing information.
     """
-    messages: Annotated[List[AnyMessage], operator.add]                  # running conversation log
+    messages: Annotated[List[AnyMessage], append_messages]               # running conversation log (bounded)
     core_context: Dict[str, Any]                                         # current frontier Thought (dict form)
-    thoughts: List[Dict[str, Any]]                                       # all active atomic Thoughts
-    injection_queue: List[Dict[str, Any]]                                # Thoughts queued for merging
-    active_agent: Literal["orchestrator", "summary", "thought_generator", "memory_swarm"]
+    thoughts: List[Thought]                                              # all active atomic Thoughts
+    injection_queue: List[Thought]                                       # Thoughts queued for merging
+    active_agent: ActiveAgent
     last_handoff_reason: Optional[str]                                   # reason for last handoff (debugging)
\ No newline at end of file
@@ -26,37 +26,251 @@
 """
 LLM factory with clean, compatible configuration for vLLM + Mistral endpoint.
 Removes deprecated http_client_kwargs and uses safe defaults.
+Optionally caches responses of deterministic (temperature=0) calls.
+All instances share pooled HTTP clients, and instances are memoized per configuration.
+Prefix KV reuse is a server feature: run vLLM with --enable-prefix-caching
+(on by default in the V1 engine); agents keep their prompt prefixes stable (see agents/base.py).
 
 File location: ./mars/infrastructure/llm.py
 """
 
 # imports
+import asyncio
+import atexit
+from typing import Any, Dict, Optional
+
+import httpx
+from langchain_core.caches import BaseCache, InMemoryCache, RETURN_VAL_TYPE
+from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_openai import ChatOpenAI
-from mars.config import AppConfig
+from mars.config import AppConfig, LLMConfig
 
 
-def create_llm(config: AppConfig) -> ChatOpenAI:
+# ──────────────────────────────────────────────────────────────────────────────
+# Helper classes
+# ──────────────────────────────────────────────────────────────────────────────
+
+_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+class _CountingCache(BaseCache):
+    """
+    Thin wrapper around a LangChain cache that counts hits and misses.
+    Entries are keyed by (serialized messages, llm_string); the llm_string
+    already encodes model, temperature and bound tools.
     """
-    Creates a ChatOpenAI instance optimized for vLLM/Mistral compatibility.
 
-    Args:
-        config (AppConfig): Application configuration with LLM settings
+    def __init__(self, inner: BaseCache):
+        self.inner = inner
 
-    Returns:
-        ChatOpenAI: Configured model instance
+    def _count(self, value: Optional[RETURN_VAL_TYPE]) -> Optional[RETURN_VAL_TYPE]:
+        _CACHE_STATS["hits" if value is not None else "misses"] += 1
+        return value
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self._count(self.inner.lookup(prompt, llm_string))
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self._count(await self.inner.alookup(prompt, llm_string))
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.inner.update(prompt, llm_string, return_val)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        await self.inner.aupdate(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.inner.clear(**kwargs)
+
+
+_CACHES: Dict[tuple, _CountingCache] = {}
+
+
+def _get_response_cache(llm_config: LLMConfig) -> Optional[BaseCache]:
+    """
+    Returns the shared response cache for this configuration, or None when
+    caching is disabled or the model samples (temperature > 0).
+    """
+    if llm_config.cache_backend == "none" or llm_config.temperature > 0:
+        return None
+
+    key = (llm_config.cache_backend, llm_config.cache_path)
+    if key not in _CACHES:
+        if llm_config.cache_backend == "sqlite":
+            try:
+                from langchain_community.cache import SQLiteCache
+            except ImportError as e:
+                raise ImportError(
+                    "cache_backend='sqlite' requires the langchain-community package"
+                ) from e
+            inner: BaseCache = SQLiteCache(database_path=llm_config.cache_path)
+        else:
+            inner = InMemoryCache()
+        _CACHES[key] = _CountingCache(inner)
+
+    return _CACHES[key]
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Returns response cache counters: {"hits": ..., "misses": ...}"""
+    return dict(_CACHE_STATS)
+
+
+_RATE_LIMITERS: Dict[tuple, InMemoryRateLimiter] = {}
+
+
+def _get_rate_limiter(llm_config: LLMConfig) -> Optional[InMemoryRateLimiter]:
+    """
+    Returns the client-side throttle for this endpoint/model, or None when
+    `rate_limit_rpm` is unset. One limiter is shared by every LLM instance
+    (blocking and streaming) so together they stay within the budget.
+    """
+    if not llm_config.rate_limit_rpm:
+        return None
+
+    key = (llm_config.base_url, llm_config.model, llm_config.rate_limit_rpm)
+    if key not in _RATE_LIMITERS:
+        _RATE_LIMITERS[key] = InMemoryRateLimiter(requests_per_second=llm_config.rate_limit_rpm / 60)
+
+    return _RATE_LIMITERS[key]
+
+
+# Keep-alive pool shared by every LLM instance (no TCP/TLS handshake per call;
+# HTTP/2 is negotiated when the endpoint supports it)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+_HTTP_TIMEOUT = 120.0
+
+
+class _PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport that keeps one connection pool per event loop.
+    Pooled connections are bound to the loop that opened them, so reusing them
+    from a later loop (e.g. a second asyncio.run) fails with "Event loop is closed".
+    Pools of closed loops are dropped when a new loop shows up.
     """
-    return ChatOpenAI(
+
+    def __init__(self):
+        self._pools: Dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            self._pools = {l: p for l, p in self._pools.items() if not l.is_closed()}
+            pool = httpx.AsyncHTTPTransport(http2=True, limits=_HTTP_LIMITS)
+            self._pools[loop] = pool
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Closes the pool of the running loop (pools of finished loops are already unusable)"""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+_HTTP_CLIENT: Optional[httpx.Client] = None
+_ASYNC_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Returns the process-wide (sync, async) httpx clients, creating them on first use"""
+    global _HTTP_CLIENT, _ASYNC_HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        _ASYNC_HTTP_CLIENT = httpx.AsyncClient(transport=_PerLoopAsyncTransport(), timeout=_HTTP_TIMEOUT)
+        atexit.register(_close_http_clients)
+    return _HTTP_CLIENT, _ASYNC_HTTP_CLIENT
+
+
+def _close_http_clients() -> None:
+    """Closes the shared httpx clients at interpreter exit"""
+    if _HTTP_CLIENT is not None:
+        _HTTP_CLIENT.close()
+    # The async client's pools belong to event loops that have finished by now;
+    # they are released with those loops (see _PerLoopAsyncTransport)
+
+
+_LLM_INSTANCES: Dict[tuple, ChatOpenAI] = {}
+
+
+def _llm_instance_key(config: AppConfig, streaming: bool) -> tuple:
+    """Identity of an LLM instance: all LLM settings (incl. the secret key) + streaming mode"""
+    return (config.llm.model_dump_json(), config.llm.api_key.get_secret_value(), streaming)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Core factories
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _base_llm_kwargs(config: AppConfig) -> Dict[str, Any]:
+    """Constructor arguments shared by the blocking and the streaming LLM"""
+    http_client, http_async_client = _get_http_clients()
+
+    return dict(
         base_url=config.llm.base_url,
         api_key=config.llm.api_key.get_secret_value(),
+        # Sent as the top-level "model" field of every request - never repeat it via extra_body
         model=config.llm.model,
         temperature=config.llm.temperature,
         max_tokens=config.llm.max_tokens,
-        # Explicitly disable streaming (prevents hang in sync invoke)
-        streaming=False,
-        # Hard timeouts to prevent silent hangs
-        request_timeout=120,
         # No retries during debug
         max_retries=0,
+        # Optional client-side throttle (shared by all graph runs and both LLM flavours)
+        rate_limiter=_get_rate_limiter(config.llm),
+        http_client=http_client,
+        http_async_client=http_async_client,
         # No deprecated kwargs
         # http_client_kwargs removed - was causing error in older langchain-openai
     )
+
+
+def create_llm(config: AppConfig) -> ChatOpenAI:
+    """
+    Creates a ChatOpenAI instance optimized for vLLM/Mistral compatibility.
+    Repeated calls with the same configuration return the same instance.
+
+    Args:
+        config (AppConfig): Application configuration with LLM settings
+
+    Returns:
+        ChatOpenAI: Configured model instance
+    """
+    key = _llm_instance_key(config, streaming=False)
+    if key not in _LLM_INSTANCES:
+        _LLM_INSTANCES[key] = ChatOpenAI(
+            **_base_llm_kwargs(config),
+            # Response cache (False → never cache, even if a global cache is set)
+            cache=_get_response_cache(config.llm) or False,
+            # Explicitly disable streaming (prevents hang in sync invoke)
+            streaming=False,
+            # Hard timeouts to prevent silent hangs
+            request_timeout=120,
+        )
+    return _LLM_INSTANCES[key]
+
+
+def create_streaming_llm(config: AppConfig) -> ChatOpenAI:
+    """
+    Creates a token-streaming ChatOpenAI instance for interactive async use.
+    No whole-request timeout: long answers are fine as long as tokens keep
+    arriving - callers bound the gap between chunks instead
+    (see `LLMConfig.stream_chunk_timeout`).
+    Never uses the response cache: a cache hit emits no token events.
+
+    Args:
+        config (AppConfig): Application configuration with LLM settings
+
+    Returns:
+        ChatOpenAI: Configured streaming model instance
+    """
+    key = _llm_instance_key(config, streaming=True)
+    if key not in _LLM_INSTANCES:
+        _LLM_INSTANCES[key] = ChatOpenAI(
+            **_base_llm_kwargs(config),
+            # No response cache - a hit would stream zero tokens
+            cache=False,
+            streaming=True,
+        )
+    return _LLM_INSTANCES[key]
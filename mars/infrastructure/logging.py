@@ -1,38 +1,149 @@
 """
 Centralized logging for MARS swarm agents
-Handles orchestrator reasoning trace, per-thought memory agent logs, and thought generator steps
+Handles orchestrator reasoning trace, memory agent evaluation log (one shared file), and thought generator steps
 File location: ./mars/infrastructure/logging.py
 """
 
 # imports
-import json
+import atexit
+import functools
+import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from mars.types import Thought
+import orjson
+
+from mars.types import Decision, DECISIONS
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helper classes
 # ──────────────────────────────────────────────────────────────────────────────
 
+class AsyncLogWriter:
+    """
+    Process-wide background writer for log lines.
+    Loggers enqueue (path, line) pairs; a daemon thread drains the queue,
+    groups pending lines per file and appends them with one write per file.
+    Keeps disk IO out of the agent reasoning path.
+    """
+
+    MAX_QUEUE_SIZE = 10000
+
+    _instance: Optional["AsyncLogWriter"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._fds: Dict[Path, int] = {}
+        self._thread = threading.Thread(target=self._drain, name="mars-log-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "AsyncLogWriter":
+        """Return the shared writer, starting it (and its atexit flush) on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    atexit.register(cls._instance.flush)
+        return cls._instance
+
+    def write(self, path: Path, line: bytes) -> None:
+        """Queue one encoded line for appending to path"""
+        try:
+            self._queue.put_nowait((path, line))
+        except queue.Full:
+            # Writer is behind - apply backpressure instead of dropping log lines
+            self._queue.put((path, line))
+
+    def flush(self) -> None:
+        """Block until every queued line has been written"""
+        self._queue.join()
+
+    def _drain(self) -> None:
+        """Writer thread loop: take everything currently queued, write it per file"""
+        while True:
+            batch: Dict[Path, List[bytes]] = {}
+            path, line = self._queue.get()
+            batch.setdefault(path, []).append(line)
+            count = 1
+            while True:
+                try:
+                    path, line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.setdefault(path, []).append(line)
+                count += 1
+
+            try:
+                for path, lines in batch.items():
+                    # Any failure (bad path, disk full, ...) only loses this file's batch;
+                    # the thread must survive, or flush() and a full queue block forever
+                    try:
+                        self._append(path, b"".join(lines))
+                    except Exception as e:
+                        print(f"Warning: log write to {path} failed → {str(e)}")
+            finally:
+                for _ in range(count):
+                    self._queue.task_done()
+
+    def _append(self, path: Path, data: bytes) -> None:
+        """Append raw bytes to path through a cached O_APPEND file descriptor"""
+        fd = self._fds.get(path)
+        if fd is not None and os.fstat(fd).st_nlink == 0:
+            # File (or its directory) was removed since it was opened - reopen
+            os.close(fd)
+            fd = None
+        if fd is None:
+            fd = self._open(path)
+            self._fds[path] = fd
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    @staticmethod
+    def _open(path: Path) -> int:
+        """Open path for appending, re-creating its directory if it was removed"""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            return os.open(path, flags, 0o644)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(path, flags, 0o644)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_parent_dir(path: Path) -> None:
+    """Create the log directory once per path (not once per logger instance)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+
 class AppendOnlyFileLogger:
     """Simple append-only file logger with ISO timestamp prefix"""
 
     def __init__(self, filepath: str | Path):
         self.path = Path(filepath)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(self.path)
+
+    @staticmethod
+    def _prefix() -> bytes:
+        """Timestamp prefix for one line"""
+        return f"[{datetime.now().isoformat(timespec='seconds')}] ".encode("utf-8")
 
     def append(self, message: str) -> None:
         """Append a line with timestamp prefix"""
-        ts = datetime.now().isoformat(timespec="seconds")
-        line = f"[{ts}] {message.strip()}\n"
-        content = self.path.read_text(encoding="utf-8") + line if self.path.exists() else line
-        self.path.write_text(content, encoding="utf-8")
+        line = self._prefix() + message.strip().encode("utf-8") + b"\n"
+        # Written asynchronously by the shared background writer
+        AsyncLogWriter.get().write(self.path, line)
 
     def append_json(self, data: Dict[str, Any]) -> None:
-        """Append one JSON line (structured event)"""
-        self.append(json.dumps(data, ensure_ascii=False))
+        """Append one JSON line (structured event), encoded straight to UTF-8 bytes by orjson"""
+        payload = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        AsyncLogWriter.get().write(self.path, self._prefix() + payload + b"\n")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -70,25 +181,29 @@ class OrchestratorTraceLogger(AppendOnlyFileLogger):
 
 class ThoughtLogger(AppendOnlyFileLogger):
     """
-    Per-thought logger for memory agent evaluations.
-    File pattern: ./mars/memories/raw/thought-<id>.log
+    Shared memory agent evaluation log.
+    All thoughts append to one file; every entry carries its thought_id.
+    File: ./mars/memories/raw/thoughts.log
     """
 
-    BASE_DIR = Path("mars/memories/raw")
+    PATH = Path("mars/memories/raw/thoughts.log")
 
-    def __init__(self, thought_id: str):
-        super().__init__(self.BASE_DIR / f"thought-{thought_id}.log")
+    def __init__(self):
+        super().__init__(self.PATH)
 
     def log_evaluation(
         self,
+        thought_id: str,
         current_orchestrator_snippet: str,
         relevance_score: float,
-        decision: str,  # "inject" | "reframe" | "generate_new"
+        decision: Decision,
         reasoning: str
     ) -> None:
-        """Record one evaluation pass by this memory agent"""
+        """Record one evaluation pass of a memory agent on thought_id"""
+        assert decision in DECISIONS, f"unknown decision: {decision!r}"
         entry = {
             "timestamp": datetime.now().isoformat(),
+            "thought_id": thought_id,
             "orchestrator_snippet": current_orchestrator_snippet.strip(),
             "relevance_score": relevance_score,
             "decision": decision,
@@ -146,16 +261,19 @@ class ThoughtGeneratorLogger(AppendOnlyFileLogger):
 # Core utilities (factories / singletons)
 # ──────────────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def get_orchestrator_logger() -> OrchestratorTraceLogger:
     """Get the shared orchestrator dialogue logger"""
     return OrchestratorTraceLogger()
 
 
-def get_thought_logger(thought: Thought) -> ThoughtLogger:
-    """Get logger for a specific thought"""
-    return ThoughtLogger(thought["thought_id"])
+@functools.lru_cache(maxsize=None)
+def get_thought_logger() -> ThoughtLogger:
+    """Get the shared memory agent evaluation logger"""
+    return ThoughtLogger()
 
 
+@functools.lru_cache(maxsize=None)
 def get_thought_generator_logger() -> ThoughtGeneratorLogger:
     """Get the shared thought generator logger"""
-    return ThoughtGeneratorLogger()
\ No newline at end of file
+    return ThoughtGeneratorLogger()
@@ -1,6 +1,6 @@
 """
 Shared types and utilities for MARS swarm system
-Central place for all type definitions (TypedDict) and helper factories.
+Central place for all type definitions (TypedDict / slotted dataclass) and helper factories.
 Ensures consistency across orchestrator, memory agents, summary, thought generator, etc.
 
 File location: ./mars/types.py
@@ -9,10 +9,35 @@ File location: ./mars/types.py
 # imports
 from typing import TypedDict, List, Dict, Any, Literal, Annotated, Optional
 from langchain_core.messages import AnyMessage
-import operator
-from datetime import datetime
+import sys
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
 from uuid import uuid4
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Constants
+# Fixed vocabularies, interned once so hot loops compare/encode shared objects
+# ──────────────────────────────────────────────────────────────────────────────
+
+Decision = Literal["inject", "reframe", "generate_new"]
+"""Outcome of one memory agent evaluation"""
+
+DECISION_INJECT: Decision = sys.intern("inject")
+DECISION_REFRAME: Decision = sys.intern("reframe")
+DECISION_GENERATE_NEW: Decision = sys.intern("generate_new")
+DECISIONS = (DECISION_INJECT, DECISION_REFRAME, DECISION_GENERATE_NEW)
+
+ActiveAgent = Literal["orchestrator", "summary", "thought_generator", "memory_swarm"]
+"""Processing unit names stored in MARSState.active_agent"""
+
+ACTIVE_ORCHESTRATOR: ActiveAgent = sys.intern("orchestrator")
+ACTIVE_SUMMARY: ActiveAgent = sys.intern("summary")
+ACTIVE_THOUGHT_GENERATOR: ActiveAgent = sys.intern("thought_generator")
+ACTIVE_MEMORY_SWARM: ActiveAgent = sys.intern("memory_swarm")
+
+MAX_MESSAGES = 200
+"""Upper bound on MARSState.messages (first message + most recent ones are kept)"""
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Helper classes
 # (none needed - we use plain TypedDict for serialization simplicity)
@@ -22,6 +47,24 @@ from uuid import uuid4
 # Operational classes / factories
 # ──────────────────────────────────────────────────────────────────────────────
 
+def append_messages(left: List[AnyMessage], right: List[AnyMessage]) -> List[AnyMessage]:
+    """
+    LangGraph reducer for MARSState.messages.
+    Appends new messages but keeps at most MAX_MESSAGES: the first message
+    (the user's query) plus the most recent ones. Copy cost per step is
+    therefore bounded instead of growing with the whole run.
+    Returns a new list - LangGraph channel copies share the stored value,
+    so the reducer must not mutate `left` in place.
+    """
+    overflow = len(left) + len(right) - MAX_MESSAGES
+    if overflow <= 0:
+        return left + right
+    if overflow >= len(left):
+        # right alone fills the window; the first message may come from right (empty left)
+        return (left or right)[:1] + right[-(MAX_MESSAGES - 1):]
+    return left[:1] + left[overflow + 1:] + right
+
+
 def create_thought(
     narrative: str,
     meta_narrative: str = "",
@@ -45,7 +88,7 @@ def create_thought(
         is_seed (bool, optional): True if this is a static seed thought, False for generated
 
     Returns:
-        Thought: Fully formed, timestamped thought dictionary
+        Thought: Fully formed, timestamped thought
     """
     if origins is None:
         origins = []
@@ -53,66 +96,114 @@ def create_thought(
         relations = []
 
     prefix = "prime" if is_seed else "gen"
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    random_part = str(uuid4())[:8]
-    thought_id = f"{prefix}-{timestamp}-{random_part}"
-
-    return {
-        "thought_timestamp": datetime.utcnow().isoformat(),
-        "thought_id": thought_id,
-        "origin_thought_ids": origins,
-        "relations": relations,
-        "narrative": narrative.strip(),
-        "meta_narrative": meta_narrative.strip(),
-        "relevance_score": float(initial_relevance),
-        "is_seed": is_seed,
-        "last_evaluated": None  # Will be set during first evaluation
-    }
+    now = datetime.now(timezone.utc)  # single clock read shared by id and timestamp
+    random_part = uuid4().hex[:8]
+    thought_id = f"{prefix}-{now:%Y%m%d-%H%M%S}-{random_part}"
+
+    return Thought(
+        thought_timestamp=now.isoformat(),
+        thought_id=thought_id,
+        origin_thought_ids=origins,
+        relations=relations,
+        narrative=narrative.strip(),
+        meta_narrative=meta_narrative.strip(),
+        relevance_score=float(initial_relevance),
+        is_seed=is_seed,
+        last_evaluated=None  # Will be set during first evaluation
+    )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Core class that runs the main logic → here we define types only
 # ──────────────────────────────────────────────────────────────────────────────
 
-class Thought(TypedDict):
+@dataclass(slots=True)
+class Thought:
     """
     Atomic unit of memory/knowledge in the MARS swarm.
-    All fields are JSON-serializable.
+    Slotted dataclass (no per-instance __dict__); all fields are JSON-serializable.
+    Supports dict-style access (thought["thought_id"], .get, keys) so call sites
+    and JSON dumps work unchanged.
     """
-    thought_timestamp: str
-    """ISO timestamp when thought was created"""
+    thought_timestamp: Optional[str]
+    """ISO timestamp when thought was created (None if unknown)"""
     thought_id: str
     """Unique identifier (prime-... for seeds, gen-... for generated)"""
-    origin_thought_ids: List[str]
+    origin_thought_ids: List[str] = field(default_factory=list)
     """IDs of thoughts this one depends on / derives from"""
-    relations: List[Dict[str, str]]
+    relations: List[Dict[str, str]] = field(default_factory=list)
     """Semantic relations: [{"type": "supports|contradicts|refines", "target_id": "...", "reason": "..."}]"""
-    narrative: str
+    narrative: str = ""
     """Core descriptive content (usually 1-4 sentences)"""
-    meta_narrative: str
+    meta_narrative: str = ""
     """High-level summary: scope, purpose, known dependencies"""
-    relevance_score: float
+    relevance_score: float = 0.5
     """Current relevance/confidence score (0.0-1.0), updated by memory agents"""
-    is_seed: bool
+    is_seed: bool = False
     """Flag: True for static seed thoughts, False for dynamically generated"""
-    last_evaluated: Optional[str]
+    last_evaluated: Optional[str] = None
     """ISO timestamp of last evaluation (set by swarm)"""
 
+    # ── dict-style access shim ────────────────────────────────────────────────
+    def __getitem__(self, key: str) -> Any:
+        if key not in _THOUGHT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _THOUGHT_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _THOUGHT_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get equivalent"""
+        return getattr(self, key) if key in _THOUGHT_FIELDS else default
+
+    def keys(self) -> tuple:
+        """Field names (lets dict(thought) and **thought work)"""
+        return _THOUGHT_FIELDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary copy (shallow)"""
+        return {name: getattr(self, name) for name in _THOUGHT_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Thought":
+        """
+        Builds a Thought from a dictionary (e.g. a seed JSON file).
+        Missing optional fields get defaults; unknown keys are ignored.
+        Epoch-second timestamps are converted to UTC ISO strings.
+        is_seed defaults to True for prime-... ids.
+        """
+        values = {name: data[name] for name in _THOUGHT_FIELDS if name in data}
+        timestamp = values.get("thought_timestamp")
+        if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+            timestamp = datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+        values["thought_timestamp"] = timestamp
+        values.setdefault("is_seed", str(data["thought_id"]).startswith("prime-"))
+        return cls(**values)
+
+
+_THOUGHT_FIELDS = tuple(f.name for f in fields(Thought))
+
 
 class MARSState(TypedDict):
     """
     Complete state schema for LangGraph graph execution.
-    Uses Annotated + operator.add for proper messages accumulation.
+    Uses Annotated + append_messages for bounded messages accumulation.
     """
-    messages: Annotated[List[AnyMessage], operator.add]
-    """Accumulated conversation history (Human/AI/System/Tool messages)"""
+    messages: Annotated[List[AnyMessage], append_messages]
+    """Accumulated conversation history (Human/AI/System/Tool messages), bounded to MAX_MESSAGES"""
     core_context: Dict[str, Any]
     """Current working context / frontier thought"""
     thoughts: List[Thought]
     """All active, tracked thoughts in the swarm"""
     injection_queue: List[Thought]
     """Thoughts queued for context injection (usually topo-sorted)"""
-    active_agent: Literal["orchestrator", "summary", "thought_generator", "memory_swarm"]
+    active_agent: ActiveAgent
     """Name of the last/currently active processing unit"""
     last_handoff_reason: Optional[str]
     """Human-readable reason for the most recent agent transition"""
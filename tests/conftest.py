@@ -0,0 +1,110 @@
+"""
+Shared pytest fixtures
+Runs a minimal OpenAI-compatible chat endpoint on localhost so LLM, runner and
+streaming paths are exercised through the real HTTP clients.
+"""
+
+# imports
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+from pydantic import SecretStr
+
+from mars.config import AppConfig, LLMConfig
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fake chat completions endpoint
+# Replies "echo: <last user message>"; a last message containing "fail" gets a 400,
+# one containing "slow" is answered after SLOW_REPLY_DELAY seconds
+# ──────────────────────────────────────────────────────────────────────────────
+
+SLOW_REPLY_DELAY = 0.5
+
+
+def _reply_for(body: dict) -> str:
+    user_messages = [m for m in body["messages"] if m["role"] == "user"]
+    content = user_messages[-1]["content"] if user_messages else ""
+    if isinstance(content, list):
+        content = " ".join(part.get("text", "") for part in content)
+    return f"echo: {content}"
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass  # keep pytest output clean
+
+    def _send(self, status: int, payload: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        reply = _reply_for(body)
+        if "slow" in reply:
+            time.sleep(SLOW_REPLY_DELAY)
+
+        if "fail" in reply:
+            error = {"error": {"message": "requested failure", "type": "invalid_request_error"}}
+            self._send(400, json.dumps(error).encode("utf-8"))
+            return
+
+        if body.get("stream"):
+            parts = ["echo", ": ", reply[len("echo: "):]]
+            events = [
+                {"id": "fake", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                 "choices": [{"index": 0, "delta": {"role": "assistant", "content": part}, "finish_reason": None}]}
+                for part in parts
+            ]
+            events.append({"id": "fake", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                           "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+            payload = b"".join(b"data: " + json.dumps(e).encode("utf-8") + b"\n\n" for e in events)
+            self._send(200, payload + b"data: [DONE]\n\n", "text/event-stream")
+            return
+
+        completion = {
+            "id": "fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        }
+        self._send(200, json.dumps(completion).encode("utf-8"))
+
+
+@pytest.fixture(scope="session")
+def fake_llm_server() -> Iterator[ThreadingHTTPServer]:
+    """Fake OpenAI endpoint; `server.requests` records every request body"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    server.daemon_threads = True
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_config(fake_llm_server, request) -> AppConfig:
+    """AppConfig pointing at the fake endpoint (unique model name → no shared LLM instances across tests)"""
+    host, port = fake_llm_server.server_address
+    return AppConfig(
+        llm=LLMConfig(
+            base_url=f"http://{host}:{port}/v1",
+            api_key=SecretStr("test-key"),
+            model=f"fake-{request.node.name}",
+            temperature=0.0,
+            max_tokens=64
+        )
+    )
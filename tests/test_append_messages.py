@@ -0,0 +1,61 @@
+"""
+Tests for the bounded MARSState.messages reducer (mars/types.py)
+"""
+
+# imports
+from langchain_core.messages import AIMessage, HumanMessage
+
+from mars.types import MAX_MESSAGES, append_messages
+
+
+def _ai(n: int) -> list:
+    return [AIMessage(content=f"ai {i}") for i in range(n)]
+
+
+def test_under_bound_concatenates():
+    left = [HumanMessage(content="query")] + _ai(3)
+    right = _ai(2)
+
+    merged = append_messages(left, right)
+
+    assert merged == left + right
+    assert len(left) == 4  # input not mutated
+
+
+def test_overflow_keeps_first_and_most_recent():
+    left = [HumanMessage(content="query")] + _ai(MAX_MESSAGES - 1)
+    right = [AIMessage(content="new 0"), AIMessage(content="new 1")]
+
+    merged = append_messages(left, right)
+
+    assert len(merged) == MAX_MESSAGES
+    assert merged[0] is left[0]
+    assert merged[1:] == left[3:] + right
+    assert len(left) == MAX_MESSAGES  # input not mutated
+
+
+def test_right_at_least_bound_keeps_first_of_left():
+    left = [HumanMessage(content="query"), AIMessage(content="old")]
+    right = _ai(MAX_MESSAGES + 5)
+
+    merged = append_messages(left, right)
+
+    assert len(merged) == MAX_MESSAGES
+    assert merged[0] is left[0]
+    assert merged[1:] == right[-(MAX_MESSAGES - 1):]
+
+
+def test_right_at_least_bound_with_empty_left_keeps_query():
+    right = [HumanMessage(content="query")] + _ai(MAX_MESSAGES + 5)
+
+    merged = append_messages([], right)
+
+    assert len(merged) == MAX_MESSAGES
+    assert merged[0] is right[0]
+    assert merged[1:] == right[-(MAX_MESSAGES - 1):]
+
+
+def test_right_exactly_bound_with_empty_left_is_unchanged():
+    right = [HumanMessage(content="query")] + _ai(MAX_MESSAGES - 1)
+
+    assert append_messages([], right) == right
@@ -0,0 +1,57 @@
+"""
+Tests for the LLM factory (mars/infrastructure/llm.py) against the fake endpoint
+"""
+
+# imports
+import asyncio
+
+import pytest
+
+from mars.infrastructure.llm import create_llm, get_cache_stats, _get_http_clients
+
+
+def test_async_calls_work_across_event_loops(fake_config):
+    llm = create_llm(fake_config)
+
+    # Each asyncio.run() creates and closes its own loop; pooled connections must not leak between them
+    for n in range(3):
+        reply = asyncio.run(llm.ainvoke(f"query {n}"))
+        assert reply.content == f"echo: query {n}"
+    # Only the pool of a live loop is kept
+    transport = _get_http_clients()[1]._transport
+    assert len(transport._pools) <= 1
+
+
+def _request_count(server) -> int:
+    return len(server.requests)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cache_counts_hits_and_misses(fake_config, fake_llm_server, tmp_path, backend):
+    fake_config.llm.cache_backend = backend
+    fake_config.llm.cache_path = str(tmp_path / "llm_cache.db")
+    llm = create_llm(fake_config)
+    before_stats, before_requests = get_cache_stats(), _request_count(fake_llm_server)
+
+    first = llm.invoke(f"cached {backend}")
+    second = llm.invoke(f"cached {backend}")
+
+    stats = get_cache_stats()
+    assert first.content == second.content == f"echo: cached {backend}"
+    assert stats["misses"] - before_stats["misses"] == 1
+    assert stats["hits"] - before_stats["hits"] == 1
+    assert _request_count(fake_llm_server) - before_requests == 1
+
+
+def test_cache_skipped_when_sampling(fake_config, fake_llm_server):
+    fake_config.llm.cache_backend = "memory"
+    fake_config.llm.temperature = 0.7
+    llm = create_llm(fake_config)
+    before_stats, before_requests = get_cache_stats(), _request_count(fake_llm_server)
+
+    llm.invoke("sampled")
+    llm.invoke("sampled")
+
+    assert llm.cache is False
+    assert get_cache_stats() == before_stats
+    assert _request_count(fake_llm_server) - before_requests == 2
@@ -0,0 +1,52 @@
+"""
+Tests for the background log writer (mars/infrastructure/logging.py)
+"""
+
+# imports
+import shutil
+from pathlib import Path
+
+from mars.infrastructure.logging import AsyncLogWriter
+
+
+def test_flush_writes_all_lines_in_order_per_path(tmp_path: Path):
+    writer = AsyncLogWriter()
+    paths = [tmp_path / f"log_{i}.log" for i in range(3)]
+
+    for n in range(500):
+        for path in paths:
+            writer.write(path, f"{path.name} {n}\n".encode("utf-8"))
+    writer.flush()
+
+    for path in paths:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines == [f"{path.name} {n}" for n in range(500)]
+
+
+def test_writer_survives_failing_path(tmp_path: Path):
+    writer = AsyncLogWriter()
+    good = tmp_path / "good.log"
+
+    writer.write(Path("bad\0path.log"), b"lost\n")  # os.open raises ValueError
+    writer.write(good, b"first\n")
+    writer.flush()
+    writer.write(good, b"second\n")
+    writer.flush()
+
+    assert writer._thread.is_alive()
+    assert good.read_text(encoding="utf-8").splitlines() == ["first", "second"]
+
+
+def test_writer_recreates_removed_log_dir(tmp_path: Path):
+    writer = AsyncLogWriter()
+    log_dir = tmp_path / "memories"
+    log_dir.mkdir()
+    path = log_dir / "thoughts.log"
+
+    writer.write(path, b"before\n")
+    writer.flush()
+    shutil.rmtree(log_dir)
+    writer.write(path, b"after\n")
+    writer.flush()
+
+    assert path.read_text(encoding="utf-8").splitlines() == ["after"]
@@ -0,0 +1,112 @@
+"""
+Tests for MARSRunner (mars/core/runner.py) against the fake endpoint.
+The full swarm graph is swapped for a one-step graph (a single orchestrator
+agent node on the real LLM) so runs terminate and answers are predictable.
+"""
+
+# imports
+import asyncio
+import time
+
+import pytest
+from langgraph.graph import StateGraph, END
+
+import mars.core.runner as runner_module
+from mars.agents.base import as_graph_node, create_agent_node
+from mars.core.graph import MARSGraph
+from mars.core.runner import MARSRunner
+from mars.types import MARSState
+from conftest import SLOW_REPLY_DELAY
+
+
+class OneStepGraph(MARSGraph):
+    """MARSGraph with a single orchestrator node (echo model → answer = "echo: <query>")"""
+
+    def _build(self) -> StateGraph:
+        builder = StateGraph(MARSState)
+        builder.add_node("orchestrator", as_graph_node(create_agent_node(self.llm, "You answer.", "orchestrator")))
+        builder.set_entry_point("orchestrator")
+        builder.add_edge("orchestrator", END)
+        return builder
+
+
+@pytest.fixture
+def runner(fake_config, monkeypatch) -> MARSRunner:
+    monkeypatch.setattr(runner_module, "MARSGraph", OneStepGraph)
+    return MARSRunner(fake_config)
+
+
+def _stored_threads(runner: MARSRunner) -> set:
+    return set(runner.graph.checkpointer.storage)
+
+
+def test_one_off_runs_leave_no_checkpoints(runner):
+    assert asyncio.run(runner.arun("hello")) == "echo: hello"
+    assert asyncio.run(runner.arun_batch(["a", "b"])) == ["echo: a", "echo: b"]
+
+    assert _stored_threads(runner) == set()
+
+
+def test_runs_with_thread_id_are_checkpointed(runner):
+    asyncio.run(runner.arun("hello", thread_id="kept"))
+
+    assert _stored_threads(runner) == {"kept"}
+
+
+def test_run_can_be_called_repeatedly(runner):
+    assert runner.run("first") == "echo: first"
+    assert runner.run("second") == "echo: second"
+
+
+def test_run_and_arun_mix_in_one_process(runner):
+    assert asyncio.run(runner.arun("async first")) == "echo: async first"
+    assert runner.run("sync") == "echo: sync"
+    assert asyncio.run(runner.arun("async second")) == "echo: async second"
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+def test_arun_stream_yields_orchestrator_tokens(runner):
+    chunks = asyncio.run(_collect(runner.arun_stream("streamed")))
+
+    assert chunks == ["echo", ": ", "streamed"]
+
+
+def test_arun_stream_repeats_tokens_with_response_cache(fake_config, monkeypatch):
+    fake_config.llm.cache_backend = "memory"
+    monkeypatch.setattr(runner_module, "MARSGraph", OneStepGraph)
+    runner = MARSRunner(fake_config)
+
+    first = asyncio.run(_collect(runner.arun_stream("cached")))
+    second = asyncio.run(_collect(runner.arun_stream("cached")))
+
+    assert first == second == ["echo", ": ", "cached"]
+
+
+def test_arun_stream_resumes_thread_started_by_arun(runner):
+    asyncio.run(runner.arun("first", thread_id="shared"))
+    asyncio.run(_collect(runner.arun_stream("second", thread_id="shared")))
+
+    state = runner.graph.app.get_state({"configurable": {"thread_id": "shared"}})
+    contents = [m.content for m in state.values["messages"]]
+    assert contents == ["first", "echo: first", "second", "echo: second"]
+
+
+def test_arun_batch_keeps_order_and_returns_failures(runner):
+    results = asyncio.run(runner.arun_batch(["a", "please fail", "c"], return_exceptions=True))
+
+    assert results[0] == "echo: a"
+    assert isinstance(results[1], Exception)
+    assert results[2] == "echo: c"
+
+
+def test_arun_batch_raises_first_failure_after_all_runs(runner):
+    started = time.perf_counter()
+
+    with pytest.raises(Exception, match="requested failure"):
+        asyncio.run(runner.arun_batch(["a", "please fail", "slow c"]))
+
+    # The failure is raised only once the slow healthy query has finished
+    assert time.perf_counter() - started >= SLOW_REPLY_DELAY
@@ -0,0 +1,119 @@
+"""
+Tests for the Thought slotted dataclass and its dict-style shim (mars/types.py)
+"""
+
+# imports
+import json
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph, END
+
+from mars.types import MARSState, Thought, create_thought, ACTIVE_ORCHESTRATOR
+
+SEEDS_DIR = Path(__file__).resolve().parent.parent / "mars" / "memories" / "seeds"
+
+
+def test_item_access_matches_attributes():
+    thought = create_thought("narrative", meta_narrative="meta", initial_relevance=0.7)
+
+    assert thought["narrative"] == thought.narrative == "narrative"
+    thought["relevance_score"] = 0.9
+    assert thought.relevance_score == 0.9
+    assert "thought_id" in thought
+    assert thought.get("last_evaluated") is None
+
+
+def test_unknown_keys_raise_or_default():
+    thought = create_thought("narrative")
+
+    with pytest.raises(KeyError):
+        thought["unknown"]
+    with pytest.raises(KeyError):
+        thought["unknown"] = 1
+    assert "unknown" not in thought
+    assert thought.get("unknown", "fallback") == "fallback"
+
+
+def test_dict_conversion_and_unpacking():
+    thought = create_thought("narrative", origins=["prime-001"])
+
+    as_dict = dict(thought)
+    assert as_dict == {**thought} == thought.to_dict()
+    assert list(as_dict) == list(thought.keys())
+    assert as_dict["origin_thought_ids"] == ["prime-001"]
+    assert json.loads(json.dumps(as_dict)) == as_dict
+
+
+@pytest.mark.parametrize("seed_file", sorted(SEEDS_DIR.glob("prime-thought-*.json")), ids=lambda p: p.name)
+def test_from_dict_on_seed_files(seed_file: Path):
+    data = json.loads(seed_file.read_text(encoding="utf-8"))
+
+    thought = Thought.from_dict(data)
+
+    assert thought.thought_id == data["thought_id"]
+    assert thought.narrative == data["narrative"]
+    assert isinstance(thought.thought_timestamp, (str, type(None)))
+    assert isinstance(thought.is_seed, bool)
+
+
+def test_from_dict_converts_epoch_timestamp():
+    thought = Thought.from_dict({"thought_id": "prime-001", "thought_timestamp": 1735689600})
+
+    assert thought.thought_timestamp == "2025-01-01T00:00:00+00:00"
+
+
+def test_from_dict_keeps_iso_timestamp():
+    thought = Thought.from_dict({"thought_id": "gen-1", "thought_timestamp": "2025-01-01T00:00:00+00:00"})
+
+    assert thought.thought_timestamp == "2025-01-01T00:00:00+00:00"
+
+
+def test_from_dict_defaults_is_seed_from_id_prefix():
+    assert Thought.from_dict({"thought_id": "prime-001"}).is_seed is True
+    assert Thought.from_dict({"thought_id": "gen-1"}).is_seed is False
+    assert Thought.from_dict({"thought_id": "prime-001", "is_seed": False}).is_seed is False
+
+
+def test_from_dict_ignores_unknown_keys_and_fills_defaults():
+    thought = Thought.from_dict({"thought_id": "gen-1", "narrative": "n", "extra": 1})
+
+    assert thought.thought_timestamp is None
+    assert thought.origin_thought_ids == []
+    assert thought.last_evaluated is None
+
+
+def test_memory_saver_round_trip():
+    thought = create_thought("narrative", meta_narrative="meta", relations=[{"type": "supports", "target_id": "prime-001"}])
+
+    def node(state: MARSState) -> dict:
+        return {"thoughts": [thought], "injection_queue": [thought]}
+
+    builder = StateGraph(MARSState)
+    builder.add_node("node", node)
+    builder.set_entry_point("node")
+    builder.add_edge("node", END)
+    checkpointer = MemorySaver()
+    app = builder.compile(checkpointer=checkpointer)
+
+    config = {"configurable": {"thread_id": "round-trip"}}
+    app.invoke(
+        {
+            "messages": [HumanMessage(content="query")],
+            "core_context": {},
+            "thoughts": [],
+            "injection_queue": [],
+            "active_agent": ACTIVE_ORCHESTRATOR,
+            "last_handoff_reason": None
+        },
+        config=config
+    )
+
+    # Read back through the serializer (not the in-memory channel values)
+    restored = checkpointer.get_tuple(config).checkpoint["channel_values"]
+    for restored_thought in (restored["thoughts"][0], restored["injection_queue"][0]):
+        assert isinstance(restored_thought, Thought)
+        assert restored_thought is not thought
+        assert restored_thought == thought